@@ -3,19 +3,39 @@
 
 from __future__ import annotations
 
+import base64
+import gzip
+import hashlib
+import http.client
 import json
+import os
 import re
 import ssl
+import tempfile
+import time
 import urllib.parse
 import urllib.request
 import urllib.error
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from operator import attrgetter
 from pathlib import Path
-from typing import Iterable
+from typing import AnyStr, Iterable, Iterator
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; the stdlib fallback writes identical bytes.
+    orjson = None
 
 ROOT = Path(__file__).resolve().parent.parent
 OUTPUT_PATH = ROOT / "data" / "stories.json"
+HTTP_CACHE_PATH = ROOT / "data" / ".http_cache.json"
+# Opt-in for local iteration: ETHICSFEED_CACHE=1 reuses responses for a while.
+DISK_CACHE_DIR = ROOT / ".cache"
+DISK_CACHE_ENABLED = os.environ.get("ETHICSFEED_CACHE") == "1"
+DISK_CACHE_TTL_SECONDS = 6 * 60 * 60
 
 ACADEMIC_QUERIES = [
     "government corruption",
@@ -115,29 +135,71 @@ NONPROFIT_TERMS = {
     "donor-funded",
 }
 
-BUSINESS_TERMS = {
-    "business",
-    "corporate",
-    "corporation",
-    "company",
-    "earnings",
-    "quarterly results",
-    "stock",
-    "share price",
-    "ipo",
-    "merger",
-    "acquisition",
-    "ceo",
-    "investor",
-    "wall street",
-}
+NEGATIVE_HIT = 1
+POSITIVE_HIT = 2
+GOVERNMENT_HIT = 4
+NONPROFIT_HIT = 8
+
+
+WORD_RE = re.compile(r"\w+")
+WHITESPACE_RE = re.compile(r"\s+")
+# Tags and whitespace runs collapse to one space in a single pass.
+MARKUP_RE = re.compile(r"(?:<[^>]+>|\s)+")
+# json.loads keeps lone surrogate escapes ("\ud83d"), which cannot be written as UTF-8.
+SURROGATE_RE = re.compile("[\ud800-\udfff]")
+
+
+def build_keyword_index(
+    categories: Iterable[tuple[Iterable[str], int]],
+) -> tuple[dict[str, int], re.Pattern[str], dict[str, int]]:
+    flags: dict[str, int] = {}
+    for terms, flag in categories:
+        for term in terms:
+            flags[term] = flags.get(term, 0) | flag
+
+    # Single words are exactly the \b-delimited tokens, so they can be looked
+    # up by set intersection; only phrases ("anti-graft", "civil society") need
+    # a regex scan.
+    word_flags = {term: flag for term, flag in flags.items() if WORD_RE.fullmatch(term)}
+    phrases = [term for term in flags if term not in word_flags]
+
+    # Only the longest phrase at each word start is captured, so a phrase also
+    # carries the flags of any shorter whole-word phrase it begins with.
+    phrase_flags: dict[str, int] = {}
+    for term in phrases:
+        combined = 0
+        for other in phrases:
+            if re.match(re.escape(other) + r"\b", term):
+                combined |= flags[other]
+        phrase_flags[term] = combined
+
+    alternatives = "|".join(re.escape(term) for term in sorted(phrases, key=len, reverse=True))
+    # Zero-width lookahead so overlapping phrases are all seen in one pass.
+    return word_flags, re.compile(r"\b(?=(" + alternatives + r")\b)"), phrase_flags
+
+
+KEYWORD_WORD_FLAGS, KEYWORD_PHRASE_RE, KEYWORD_PHRASE_FLAGS = build_keyword_index(
+    [
+        (NEGATIVE_KEYWORDS, NEGATIVE_HIT),
+        (POSITIVE_KEYWORDS, POSITIVE_HIT),
+        (GOVERNMENT_TERMS, GOVERNMENT_HIT),
+        (NONPROFIT_TERMS, NONPROFIT_HIT),
+    ]
+)
+
+# Byte twins of the index; every keyword is ASCII.
+WORD_BYTES_RE = re.compile(WORD_RE.pattern.encode())
+KEYWORD_WORD_FLAGS_BYTES = {term.encode(): flag for term, flag in KEYWORD_WORD_FLAGS.items()}
+KEYWORD_PHRASE_BYTES_RE = re.compile(KEYWORD_PHRASE_RE.pattern.encode())
+KEYWORD_PHRASE_FLAGS_BYTES = {term.encode(): flag for term, flag in KEYWORD_PHRASE_FLAGS.items()}
 
 MAX_STORIES_PER_COLUMN = 60
 ROWS_PER_QUERY = 40
+FETCH_WORKERS = 8
 USER_AGENT = "nonmarket-ethics-scholarship-feed/1.0 (+https://github.com/rkchristensen/nonmarket_ethics_scholarship_feed)"
 
 
-@dataclass
+@dataclass(slots=True)
 class Story:
     title: str
     short_title: str
@@ -147,6 +209,7 @@ class Story:
     sentiment: str
     government: bool
     nonprofit: bool
+    published_ts: float = 0.0
 
 
 def crossref_works_url(query: str) -> str:
@@ -163,129 +226,235 @@ def crossref_works_url(query: str) -> str:
     return f"https://api.crossref.org/works?{params}"
 
 
-def fetch(url: str) -> bytes:
-    request = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+def load_http_cache() -> dict[str, dict]:
+    try:
+        cache = json.loads(HTTP_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_http_cache(cache: dict[str, dict]) -> None:
+    HTTP_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    HTTP_CACHE_PATH.write_text(json.dumps(cache), encoding="utf-8")
+
+
+def open_url(url: str, headers: dict[str, str]) -> tuple[int, bytes, http.client.HTTPMessage]:
+    request = urllib.request.Request(url, headers=headers)
     try:
-        with urllib.request.urlopen(request, timeout=20) as response:
-            return response.read()
-    except urllib.error.URLError as exc:
-        if isinstance(exc.reason, ssl.SSLCertVerificationError):
+        try:
+            with urllib.request.urlopen(request, timeout=20) as response:
+                return response.status, response.read(), response.headers
+        except urllib.error.URLError as exc:
+            if not isinstance(exc.reason, ssl.SSLCertVerificationError):
+                raise
             # Local Python setups occasionally miss trusted cert bundles.
             insecure = ssl._create_unverified_context()
             with urllib.request.urlopen(request, timeout=20, context=insecure) as response:
-                return response.read()
+                return response.status, response.read(), response.headers
+    except urllib.error.HTTPError as exc:
+        # fetch decides what to do with 304s and errors.
+        return exc.code, exc.read(), exc.headers
+
+
+def fetch(url: str, cache: dict[str, dict]) -> bytes:
+    headers = {"User-Agent": USER_AGENT, "Accept-Encoding": "gzip"}
+    cached = cache.get(url)
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    status, body, response_headers = open_url(url, headers)
+    if status == 304 and cached:
+        return gzip.decompress(base64.b64decode(cached["body"]))
+    if status != 200:
+        raise urllib.error.HTTPError(url, status, http.client.responses.get(status, ""), response_headers, None)
+    if response_headers.get("Content-Encoding") == "gzip":
+        body = gzip.decompress(body)
+
+    etag = response_headers.get("ETag")
+    last_modified = response_headers.get("Last-Modified")
+    if etag or last_modified:
+        # Each worker writes only its own URL key, so no lock is needed.
+        cache[url] = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "body": base64.b64encode(gzip.compress(body)).decode("ascii"),
+        }
+    return body
+
+
+def disk_cache_path(url: str) -> Path:
+    return DISK_CACHE_DIR / hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+
+def write_disk_cache(path: Path, body: bytes) -> None:
+    DISK_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    # Write then rename so an interrupted run never leaves a partial entry.
+    handle = tempfile.NamedTemporaryFile(dir=DISK_CACHE_DIR, delete=False)
+    try:
+        with handle:
+            handle.write(gzip.compress(body))
+        os.replace(handle.name, path)
+    except BaseException:
+        os.unlink(handle.name)
         raise
 
 
-def parse_date_parts(raw: object) -> datetime:
+def fetch_cached(url: str, cache: dict[str, dict]) -> bytes:
+    if not DISK_CACHE_ENABLED:
+        return fetch(url, cache)
+
+    path = disk_cache_path(url)
+    try:
+        if time.time() - path.stat().st_mtime < DISK_CACHE_TTL_SECONDS:
+            body = gzip.decompress(path.read_bytes())
+            if body:
+                return body
+    except (OSError, EOFError, zlib.error):
+        # Missing, truncated or corrupt entries are treated as a miss.
+        pass
+
+    body = fetch(url, cache)
+    write_disk_cache(path, body)
+    return body
+
+
+def parse_date_parts(raw: object, now: datetime) -> datetime:
     if not isinstance(raw, dict):
-        return datetime.now(timezone.utc)
+        return now
     date_parts = raw.get("date-parts")
     if not isinstance(date_parts, list) or not date_parts:
-        return datetime.now(timezone.utc)
+        return now
     first = date_parts[0]
     if not isinstance(first, list) or not first:
-        return datetime.now(timezone.utc)
-    year = int(first[0])
-    month = int(first[1]) if len(first) > 1 else 1
-    day = int(first[2]) if len(first) > 2 else 1
+        return now
     try:
+        year = int(first[0])
+        month = int(first[1]) if len(first) > 1 else 1
+        day = int(first[2]) if len(first) > 2 else 1
         dt = datetime(year, month, day, tzinfo=timezone.utc)
-        now = datetime.now(timezone.utc)
-        if dt.year < 1900 or dt.year > now.year + 1:
-            return now
-        return dt
-    except ValueError:
-        return datetime.now(timezone.utc)
+    except (TypeError, ValueError):
+        return now
+    if dt.year < 1900 or dt.year > now.year + 1:
+        return now
+    return dt
 
 
 def short_title(title: str, limit: int = 95) -> str:
-    cleaned = re.sub(r"\s+", " ", title).strip()
+    cleaned = WHITESPACE_RE.sub(" ", title).strip()
     if len(cleaned) <= limit:
         return cleaned
     return cleaned[: limit - 1].rstrip() + "…"
 
 
-def contains_any(text: str, terms: Iterable[str]) -> bool:
-    for term in terms:
-        pattern = r"\b" + re.escape(term) + r"\b"
-        if re.search(pattern, text):
-            return True
-    return False
+def replace_surrogates(value: str) -> str:
+    if value.isascii():
+        return value
+    return SURROGATE_RE.sub("\ufffd", value)
 
 
 def clean_text(value: str) -> str:
     # Crossref abstracts can include lightweight markup like <jats:p>.
-    no_tags = re.sub(r"<[^>]+>", " ", value)
-    return re.sub(r"\s+", " ", no_tags).strip()
+    return MARKUP_RE.sub(" ", replace_surrogates(value)).strip()
+
+
+def strip_whitespace(value: str) -> str:
+    # URLs and DOIs carry no markup, and some DOIs contain literal "<...>".
+    return WHITESPACE_RE.sub(" ", replace_surrogates(value)).strip()
+
+
+def scan_keywords(
+    text: AnyStr,
+    word_re: re.Pattern[AnyStr],
+    word_flags: dict[AnyStr, int],
+    phrase_re: re.Pattern[AnyStr],
+    phrase_flags: dict[AnyStr, int],
+) -> int:
+    hits = 0
+    for word in word_flags.keys() & set(word_re.findall(text)):
+        hits |= word_flags[word]
+    for match in phrase_re.finditer(text):
+        hits |= phrase_flags[match.group(1)]
+    return hits
+
+
+def keyword_hits(text: str) -> int:
+    # Byte patterns are faster and, for ASCII text, match exactly like the str
+    # ones. Other text keeps the str patterns so \w and \b stay Unicode-aware.
+    if text.isascii():
+        return scan_keywords(
+            text.encode("ascii"),
+            WORD_BYTES_RE,
+            KEYWORD_WORD_FLAGS_BYTES,
+            KEYWORD_PHRASE_BYTES_RE,
+            KEYWORD_PHRASE_FLAGS_BYTES,
+        )
+    return scan_keywords(text, WORD_RE, KEYWORD_WORD_FLAGS, KEYWORD_PHRASE_RE, KEYWORD_PHRASE_FLAGS)
 
 
-def classify_sentiment(text: str) -> str | None:
-    if contains_any(text, NEGATIVE_KEYWORDS):
+def classify_sentiment(hits: int) -> str | None:
+    if hits & NEGATIVE_HIT:
         return "negative"
-    if contains_any(text, POSITIVE_KEYWORDS):
+    if hits & POSITIVE_HIT:
         return "positive"
     return None
 
 
-def parse_crossref_items(payload_bytes: bytes) -> list[dict]:
-    parsed: list[dict] = []
+def parse_crossref_item(item: dict, now: datetime) -> dict | None:
+    title_values = item.get("title") or []
+    title = ""
+    if isinstance(title_values, list) and title_values:
+        title = clean_text(str(title_values[0]))
+    elif isinstance(title_values, str):
+        title = clean_text(title_values)
+
+    url = strip_whitespace(str(item.get("URL") or ""))
+    doi = strip_whitespace(str(item.get("DOI") or ""))
+    if doi and not url:
+        url = f"https://doi.org/{doi}"
+    # normalize_story rejects these anyway; skip cleaning the rest.
+    if not title or not url:
+        return None
+
+    abstract = clean_text(str(item.get("abstract") or ""))
+
+    source = ""
+    container_values = item.get("container-title") or []
+    if isinstance(container_values, list) and container_values:
+        source = clean_text(str(container_values[0]))
+    elif isinstance(container_values, str):
+        source = clean_text(container_values)
+    if not source:
+        source = clean_text(str(item.get("publisher") or "")) or "Unknown source"
+
+    # Falls through with the (possibly empty) "created" value.
+    for date_key in ("published-online", "published-print", "published", "created"):
+        date_value = item.get(date_key)
+        if date_value:
+            break
+    published_at = parse_date_parts(date_value, now)
+
+    return {
+        "title": title,
+        "url": url,
+        "doi": doi,
+        "published_at": published_at,
+        "source": source,
+        "abstract": abstract,
+    }
+
+
+def parse_crossref_items(payload_bytes: bytes) -> Iterator[dict]:
     data = json.loads(payload_bytes.decode("utf-8", errors="replace"))
     items = data.get("message", {}).get("items", [])
     if not isinstance(items, list):
-        return parsed
-
-    for item in items:
-        title_values = item.get("title") or []
-        title = ""
-        if isinstance(title_values, list) and title_values:
-            title = clean_text(str(title_values[0]))
-        elif isinstance(title_values, str):
-            title = clean_text(title_values)
-
-        url = clean_text(str(item.get("URL") or ""))
-        doi = clean_text(str(item.get("DOI") or ""))
-        abstract = clean_text(str(item.get("abstract") or ""))
-
-        source = ""
-        container_values = item.get("container-title") or []
-        if isinstance(container_values, list) and container_values:
-            source = clean_text(str(container_values[0]))
-        elif isinstance(container_values, str):
-            source = clean_text(container_values)
-        if not source:
-            source = clean_text(str(item.get("publisher") or "")) or "Unknown source"
-
-        published_at = (
-            parse_date_parts(item.get("published-online"))
-            if item.get("published-online")
-            else parse_date_parts(item.get("published-print"))
-            if item.get("published-print")
-            else parse_date_parts(item.get("published"))
-            if item.get("published")
-            else parse_date_parts(item.get("created"))
-        )
-
-        if doi and not url:
-            url = f"https://doi.org/{doi}"
-
-        parsed.append(
-            {
-                "title": title,
-                "url": url,
-                "doi": doi,
-                "published_at": published_at,
-                "source": source,
-                "abstract": abstract,
-            }
-        )
-    return parsed
-
+        return
 
-def should_skip_business_only(text: str) -> bool:
-    has_business = contains_any(text, BUSINESS_TERMS)
-    has_relevant_domain = contains_any(text, GOVERNMENT_TERMS) or contains_any(text, NONPROFIT_TERMS)
-    return has_business and not has_relevant_domain
+    now = datetime.now(timezone.utc)
+    yield from filter(None, (parse_crossref_item(item, now) for item in items))
 
 
 def normalize_story(raw: dict) -> Story | None:
@@ -293,17 +462,17 @@ def normalize_story(raw: dict) -> Story | None:
         return None
 
     text = f'{raw["title"]} {raw["source"]} {raw.get("abstract", "")}'.lower()
-    if should_skip_business_only(text):
-        return None
+    hits = keyword_hits(text)
 
-    sentiment = classify_sentiment(text)
-    if sentiment is None:
+    # Business-only coverage has neither a government nor a nonprofit term,
+    # so this one check also rejects it.
+    is_government = bool(hits & GOVERNMENT_HIT)
+    is_nonprofit = bool(hits & NONPROFIT_HIT)
+    if not is_government and not is_nonprofit:
         return None
 
-    is_government = contains_any(text, GOVERNMENT_TERMS)
-    is_nonprofit = contains_any(text, NONPROFIT_TERMS)
-
-    if not is_government and not is_nonprofit:
+    sentiment = classify_sentiment(hits)
+    if sentiment is None:
         return None
 
     return Story(
@@ -315,16 +484,21 @@ def normalize_story(raw: dict) -> Story | None:
         sentiment=sentiment,
         government=is_government,
         nonprofit=is_nonprofit,
+        published_ts=raw["published_at"].timestamp(),
     )
 
 
-def collect_stories() -> list[Story]:
+def collect_stories(http_cache: dict[str, dict]) -> list[Story]:
     collected: list[Story] = []
     seen_keys: set[str] = set()
 
-    for query in ACADEMIC_QUERIES:
+    # Fetch concurrently, but consume in query order so dedup stays deterministic.
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        futures = [executor.submit(fetch_cached, crossref_works_url(query), http_cache) for query in ACADEMIC_QUERIES]
+
+    for future in futures:
         try:
-            response = fetch(crossref_works_url(query))
+            response = future.result()
         except Exception:
             continue
 
@@ -340,37 +514,54 @@ def collect_stories() -> list[Story]:
 
     return sorted(
         collected,
-        key=lambda s: s.published_at,
+        key=attrgetter("published_ts"),
         reverse=True,
     )
 
 
 def build_output(stories: list[Story]) -> dict:
-    government = [s for s in stories if s.government][:MAX_STORIES_PER_COLUMN]
-    nonprofit = [s for s in stories if s.nonprofit][:MAX_STORIES_PER_COLUMN]
-
-    def to_dict(story: Story) -> dict:
-        return {
-            "title": story.title,
-            "short_title": story.short_title,
-            "url": story.url,
-            "source": story.source,
-            "published_at": story.published_at,
-            "sentiment": story.sentiment,
-        }
+    # Stories are already newest first, so stop once both columns are full.
+    government: list[dict] = []
+    nonprofit: list[dict] = []
+    for story in stories:
+        wants_government = story.government and len(government) < MAX_STORIES_PER_COLUMN
+        wants_nonprofit = story.nonprofit and len(nonprofit) < MAX_STORIES_PER_COLUMN
+        if wants_government or wants_nonprofit:
+            entry = {
+                "title": story.title,
+                "short_title": story.short_title,
+                "url": story.url,
+                "source": story.source,
+                "published_at": story.published_at,
+                "sentiment": story.sentiment,
+            }
+            if wants_government:
+                government.append(entry)
+            if wants_nonprofit:
+                nonprofit.append(entry)
+        if len(government) == len(nonprofit) == MAX_STORIES_PER_COLUMN:
+            break
 
     return {
         "updated_at": datetime.now(timezone.utc).isoformat(),
-        "government": [to_dict(s) for s in government],
-        "nonprofit": [to_dict(s) for s in nonprofit],
+        "government": government,
+        "nonprofit": nonprofit,
     }
 
 
+def encode_payload(payload: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
+
+
 def main() -> None:
-    stories = collect_stories()
+    http_cache = load_http_cache()
+    stories = collect_stories(http_cache)
+    save_http_cache(http_cache)
     payload = build_output(stories)
     OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
-    OUTPUT_PATH.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    OUTPUT_PATH.write_bytes(encode_payload(payload))
     print(f"Wrote {OUTPUT_PATH} with {len(payload['government'])} government and {len(payload['nonprofit'])} nonprofit stories.")
 
 